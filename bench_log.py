@@ -0,0 +1,205 @@
+"""
+Blizzard Log Benchmarks - log() throughput/latency and dashboard HTTP latency.
+
+Runs entirely in a temp directory with no network or Solana dependencies:
+    python bench_log.py                  # full run
+    python bench_log.py --quick          # smaller run for a quick before/after check
+    python bench_log.py --max-log-p99-ms 1 --max-http-p99-ms 50   # regression gate (exit 1 on failure)
+"""
+
+import os
+import sys
+import time
+import json
+import gzip
+import shutil
+import argparse
+import tempfile
+import threading
+import http.client
+from contextlib import contextmanager
+
+import logsink
+import server
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+@contextmanager
+def quiet_stdout():
+    """Send log()'s console output to /dev/null so the terminal isn't the bottleneck."""
+    saved = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            sys.stdout = saved
+
+def fresh_sink(workdir: str, prefill: int) -> logsink.LogSink:
+    """Install a new sink with empty files under workdir/web/public, pre-filled with `prefill` entries."""
+    public = os.path.join(workdir, "web", "public")
+    shutil.rmtree(public, ignore_errors=True)
+    sink = logsink.LogSink(snapshot_path=os.path.join(public, "logs.json"),
+                           stream_path=os.path.join(public, "logs.jsonl"))
+    logsink.sink = sink
+    sink.start()
+    for i in range(prefill):
+        sink.emit({"timestamp": "00:00:00", "tag": "PREFILL", "msg": f"entry {i}", "color": "[97m"})
+    sink.flush()
+    return sink
+
+
+# --- LOG() BENCHMARK ---
+def bench_log(workdir: str, threads: int, prefill: int, calls: int, filtered: bool = False) -> dict:
+    """filtered=True logs DIM (DEBUG) entries, which LOG_LEVEL=INFO drops before formatting."""
+    fresh_sink(workdir, prefill)
+    color = logsink.Style.DIM if filtered else logsink.Style.CYAN
+    per_thread = calls // threads
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def writer(idx: int):
+        samples = latencies[idx]
+        barrier.wait()
+        for i in range(per_thread):
+            t0 = time.perf_counter_ns()
+            logsink.log("BENCH", "thread {idx} call {i} | Balance: {bal:.4f} SOL", color, idx=idx, i=i, bal=i * 0.001)
+            samples.append(time.perf_counter_ns() - t0)
+
+    with quiet_stdout():
+        workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+        for w in workers:
+            w.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - start
+        logsink.sink.flush()
+
+    samples = [s for thread_samples in latencies for s in thread_samples]
+    return {
+        "calls/s": len(samples) / elapsed,
+        "p50_us": percentile(samples, 50) / 1e3,
+        "p99_us": percentile(samples, 99) / 1e3,
+        "max_us": max(samples) / 1e3,
+    }
+
+
+# --- HTTP BENCHMARK ---
+@contextmanager
+def dashboard_server():
+    httpd = server.DashboardServer(("127.0.0.1", 0), server.Handler)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    try:
+        yield httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+def bench_http(port: int, mode: str, pollers: int, requests_per_poller: int) -> dict:
+    """Each poller keeps one connection open and polls like index.html does.
+
+    full: plain GET of logs.json, conditional: GET with If-None-Match, feed: /api/logs cursor.
+    """
+    latencies = [[] for _ in range(pollers)]
+    bytes_read = [0] * pollers
+    barrier = threading.Barrier(pollers + 1)
+
+    def poller(idx: int):
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        headers = {"Accept-Encoding": "gzip"}
+        cursor = 0
+        barrier.wait()
+        for _ in range(requests_per_poller):
+            path = f"/api/logs?since={cursor}" if mode == "feed" else "/public/logs.json"
+            t0 = time.perf_counter_ns()
+            conn.request("GET", path, headers=headers)
+            res = conn.getresponse()
+            body = res.read()
+            latencies[idx].append(time.perf_counter_ns() - t0)
+            bytes_read[idx] += len(body)
+            if mode == "conditional" and res.getheader("ETag"):
+                headers["If-None-Match"] = res.getheader("ETag")
+            elif mode == "feed":
+                if res.getheader("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                cursor = json.loads(body)["cursor"]
+        conn.close()
+
+    workers = [threading.Thread(target=poller, args=(i,)) for i in range(pollers)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    samples = [s for poller_samples in latencies for s in poller_samples]
+    return {
+        "req/s": len(samples) / elapsed,
+        "p50_ms": percentile(samples, 50) / 1e6,
+        "p99_ms": percentile(samples, 99) / 1e6,
+        "bytes/req": sum(bytes_read) / len(samples),
+    }
+
+
+def print_row(label: str, result: dict):
+    cols = "  ".join(f"{k}={v:>10.1f}" if v >= 100 else f"{k}={v:>10.3f}" for k, v in result.items())
+    print(f"  {label:<28} {cols}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark main.log() and the server.py dashboard")
+    parser.add_argument("--quick", action="store_true", help="fewer calls/requests per scenario")
+    parser.add_argument("--max-log-p99-ms", type=float, help="fail if any log() scenario p99 exceeds this")
+    parser.add_argument("--max-http-p99-ms", type=float, help="fail if any HTTP scenario p99 exceeds this")
+    args = parser.parse_args()
+
+    calls = 4_800 if args.quick else 48_000
+    requests_per_poller = 20 if args.quick else 100
+    capacity = logsink.LOG_BUFFER_SIZE
+    failures = []
+    logsink.set_log_level("INFO")
+
+    workdir = tempfile.mkdtemp(prefix="blizzard-bench-")
+    cwd = os.getcwd()
+    os.chdir(workdir)  # server.Handler serves web/ relative to the cwd
+    try:
+        print(f"log() | {calls} calls per scenario, buffer capacity {capacity}")
+        for prefill in (0, capacity // 2, capacity):
+            for threads in (1, 4, 16):
+                result = bench_log(workdir, threads, prefill, calls)
+                print_row(f"threads={threads:<2} buffer={prefill}/{capacity}", result)
+                if args.max_log_p99_ms is not None and result["p99_us"] / 1e3 > args.max_log_p99_ms:
+                    failures.append(f"log() threads={threads} buffer={prefill}: p99 {result['p99_us']:.0f}us")
+        for threads in (1, 16):
+            print_row(f"threads={threads:<2} below LOG_LEVEL", bench_log(workdir, threads, capacity, calls, filtered=True))
+
+        print(f"\nHTTP | full buffer ({capacity} entries), {requests_per_poller} requests per poller")
+        fresh_sink(workdir, capacity)
+        with dashboard_server() as port:
+            for mode in ("full", "conditional", "feed"):
+                for pollers in (1, 16, 64):
+                    result = bench_http(port, mode, pollers, requests_per_poller)
+                    print_row(f"{mode:<12} pollers={pollers}", result)
+                    if args.max_http_p99_ms is not None and result["p99_ms"] > args.max_http_p99_ms:
+                        failures.append(f"HTTP {mode} pollers={pollers}: p99 {result['p99_ms']:.1f}ms")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if failures:
+        print("\n❌ REGRESSION:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
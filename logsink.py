@@ -0,0 +1,204 @@
+"""
+Blizzard Log Sink - Non-blocking log persistence for the Web UI.
+
+log() only touches memory: entries go into a ring buffer plus a pending batch.
+A single background writer drains the batch, appends it to an append-only JSONL
+stream and republishes the last N entries as web/public/logs.json.
+Every entry carries a monotonically increasing "seq" used as the feed cursor.
+
+Entries below LOG_LEVEL are dropped before any formatting or I/O happens.
+"""
+
+import os
+import json
+import threading
+import time
+import atexit
+from collections import deque
+from datetime import datetime
+
+
+# --- TERMINAL STYLING ---
+class Style:
+    RESET = "\033[0m"
+    BOLD = "\033[1m"
+    DIM = "\033[2m"
+
+    # Foreground
+    RED = "\033[91m"
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    BLUE = "\033[94m"
+    MAGENTA = "\033[95m"
+    CYAN = "\033[96m"
+    WHITE = "\033[97m"
+
+
+# --- SEVERITY LEVELS ---
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARN": WARNING, "WARNING": WARNING, "ERROR": ERROR}
+TAG_LEVELS = {"ERROR": ERROR, "WARN": WARNING}  # Tags that carry their own severity
+
+_min_level = LEVELS.get(os.getenv("LOG_LEVEL", "INFO").upper(), INFO)
+
+def set_log_level(name: str):
+    """Set the minimum severity by name (DEBUG/INFO/WARN/ERROR). Unknown names mean INFO."""
+    global _min_level
+    _min_level = LEVELS.get(name.strip().upper(), INFO)
+
+def level_for(tag: str, color: str) -> int:
+    """Severity of an entry without an explicit level: WARN/ERROR tags, YELLOW = WARNING, DIM = DEBUG."""
+    if tag in TAG_LEVELS:
+        return TAG_LEVELS[tag]
+    if color == Style.YELLOW:
+        return WARNING
+    return DEBUG if color == Style.DIM else INFO
+
+
+# --- SINK SETTINGS ---
+LOG_FILE_PATH = "web/public/logs.json"      # Snapshot polled by the Web UI (last N entries)
+LOG_STREAM_PATH = "web/public/logs.jsonl"   # Append-only history, one entry per line
+LOG_BUFFER_SIZE = int(os.getenv("LOG_BUFFER_SIZE", "500"))
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "0.25"))
+LOG_SEGMENT_BYTES = int(os.getenv("LOG_SEGMENT_BYTES", str(5 * 1024 * 1024)))
+# Publish structured fields in logs.json / logs.jsonl (the dashboard doesn't read them)
+LOG_FIELDS = os.getenv("LOG_FIELDS", "false").lower() == "true"
+
+
+class LogSink:
+    """In-memory ring buffer flushed in batches by one background writer thread."""
+
+    def __init__(self, snapshot_path: str = LOG_FILE_PATH, stream_path: str = LOG_STREAM_PATH,
+                 capacity: int = LOG_BUFFER_SIZE, flush_interval: float = LOG_FLUSH_INTERVAL,
+                 segment_bytes: int = LOG_SEGMENT_BYTES):
+        self.snapshot_path = snapshot_path
+        self.stream_path = stream_path
+        self.flush_interval = flush_interval
+        self.segment_bytes = segment_bytes
+
+        self._ring = deque(maxlen=capacity)
+        self._pending = []
+        self._seq = 0
+        self._lock = threading.Lock()       # Guards ring + pending (memory only, never held during I/O)
+        self._io_lock = threading.Lock()    # Serializes flushes (writer thread vs. explicit flush())
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Create web/public, restore the last snapshot and start the writer (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            # Restore under the lock so no entry can be stamped with a seq before history is loaded
+            os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+            if not os.path.exists(self.snapshot_path):
+                self._write_snapshot([])
+            self._restore()
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def emit(self, entry: dict):
+        """Stamp the entry with the next seq and queue it. Never blocks on disk."""
+        if self._thread is None:
+            self.start()
+        with self._lock:
+            self._seq += 1
+            entry["seq"] = self._seq
+            self._ring.append(entry)
+            self._pending.append(entry)
+            wake = len(self._pending) == 1
+        if wake:
+            self._wake.set()
+
+    def flush(self):
+        """Write every pending entry now (called by the writer and at exit)."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                snapshot = list(self._ring)
+            if not batch:
+                return
+            try:
+                self._append_stream(batch)
+                self._write_snapshot(snapshot)
+            except Exception as e:
+                print(f"Log Error: {e}")
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            # Let a burst of log() calls pile up so one write covers all of them
+            time.sleep(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _restore(self):
+        """Reload the ring from the last published snapshot so restarts keep history (and seq)."""
+        try:
+            with open(self.snapshot_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = []
+        for entry in data:
+            if isinstance(entry, dict):
+                # Snapshots from before seq existed get numbered in order
+                self._seq = max(self._seq + 1, entry.get("seq", 0))
+                entry["seq"] = self._seq
+                self._ring.append(entry)
+
+    def _append_stream(self, batch: list):
+        lines = "".join(json.dumps(entry) + "\n" for entry in batch)
+        with open(self.stream_path, "a") as f:
+            f.write(lines)
+            size = f.tell()
+        if size > self.segment_bytes:
+            # Segment rotation: keep the current file plus one previous segment
+            os.replace(self.stream_path, self.stream_path + ".1")
+
+    def _write_snapshot(self, snapshot: list):
+        # Atomic replace so the web server never serves a half-written file
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.snapshot_path)
+
+
+sink = LogSink()
+
+def init_log_file():
+    """Ensure web/public exists and start the background log writer"""
+    sink.start()
+
+def log(tag: str, msg: str, color: str = Style.WHITE, level: int | None = None, **fields):
+    """
+    Print and persist one entry. With fields, msg is a str.format template:
+        log("SYSTEM", "Balance: {bal:.4f} SOL", Style.DIM, bal=bal)
+    It is only rendered if the entry passes LOG_LEVEL. With LOG_FIELDS=true the fields are also
+    published under "fields" (non-JSON values as str, so no exceptions/frames are kept alive).
+    """
+    if level is None:
+        level = level_for(tag, color)
+    if level < _min_level:
+        return
+    if fields:
+        msg = msg.format(**fields)
+
+    timestamp = datetime.now().strftime("%H:%M:%S")
+
+    # 1. Console Output
+    print(f"{Style.DIM}[{timestamp}]{Style.RESET} {color}{Style.BOLD}[{tag:^10}]{Style.RESET} {msg}")
+
+    # 2. JSON Output for Web UI (persisted by the writer thread)
+    entry = {
+        "timestamp": timestamp,
+        "tag": tag,
+        "level": LEVEL_NAMES.get(level, "INFO"),
+        "msg": msg,
+        "color": color.replace("\033", "") # Store raw ansi code part or just the code
+    }
+    if fields and LOG_FIELDS:
+        entry["fields"] = {k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v)
+                           for k, v in fields.items()}
+    sink.emit(entry)
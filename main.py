@@ -3,6 +3,8 @@ Slurp ($SLURP) - The Hyper-Liquidity Bot
 V4.2 Update: ROBUSTNESS (Async Queue + Auto-Pool Switching + Accumulator + RevShare)
 """
 
+from __future__ import annotations
+
 import os
 import time
 import base58
@@ -10,81 +12,20 @@ import requests
 import json
 import threading
 import random
-import websocket
 import queue
-from datetime import datetime
+from typing import TYPE_CHECKING
 from dotenv import load_dotenv
-from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction, Transaction
-from solders.system_program import transfer, TransferParams
-from solders.message import Message
-from solana.rpc.api import Client
-from solders.pubkey import Pubkey
-
-
-# --- TERMINAL STYLING ---
-class Style:
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
-    
-    # Foreground
-    RED = "\033[91m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    BLUE = "\033[94m"
-    MAGENTA = "\033[95m"
-    CYAN = "\033[96m"
-    WHITE = "\033[97m"
-
-
-# --- LOGGING SYSTEM ---
-LOG_FILE_PATH = "web/public/logs.json"
-log_lock = threading.Lock()
-log_buffer = []
-
-def init_log_file():
-    """Ensure web/public exists and init empty JSON if needed"""
-    os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
-    if not os.path.exists(LOG_FILE_PATH):
-        with open(LOG_FILE_PATH, "w") as f:
-            json.dump([], f)
-
-def log(tag: str, msg: str, color: str = Style.WHITE):
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    
-    # 1. Console Output
-    print(f"{Style.DIM}[{timestamp}]{Style.RESET} {color}{Style.BOLD}[{tag:^10}]{Style.RESET} {msg}")
-    
-    # 2. JSON Output for Web UI
-    entry = {
-        "timestamp": timestamp,
-        "tag": tag,
-        "msg": msg,
-        "color": color.replace("\033", "") # Store raw ansi code part or just the code
-    }
-    
-    with log_lock:
-        try:
-            # Efficient implementation: In a real high-perf app, we'd append or use a rotating file
-            # For this 'simple' request, reading/writing full list is okay up to a few KB.
-            # We keep memory buffer to avoid consistent reads, but here we restart often.
-            
-            # Let's load, append, save to be safe across restarts
-            if not os.path.exists(LOG_FILE_PATH): init_log_file()
-            
-            with open(LOG_FILE_PATH, "r") as f:
-                try:
-                    data = json.load(f)
-                except: data = []
-            
-            data.append(entry)
-            if len(data) > 500: data = data[-500:] # Keep last 500
-            
-            with open(LOG_FILE_PATH, "w") as f:
-                json.dump(data, f)
-        except Exception as e:
-            print(f"Log Error: {e}")
+
+# solana/solders/websocket are imported where they are used so importing this
+# module (railway_entry.py, bench_log.py) doesn't pay for the SDKs up front
+if TYPE_CHECKING:
+    from solders.keypair import Keypair
+    from solana.rpc.api import Client
+
+
+# --- TERMINAL STYLING & LOGGING SYSTEM ---
+# Log persistence lives in logsink.py (ring buffer + background writer)
+from logsink import Style, log, init_log_file, set_log_level, INFO, LOG_FILE_PATH
 
 def print_banner():
     # Attempt to enable ANSI on Windows
@@ -111,7 +52,8 @@ def startup_animation():
         ("SYSTEM", "BLIZZARD MODE ENGAGED... ❄️", Style.CYAN, 0.6)
     ]
     for tag, msg, color, delay in steps:
-        time.sleep(delay)
+        if not FAST_STARTUP:
+            time.sleep(delay)
         log(tag, msg, color)
     print(f"\n{Style.BOLD}{Style.GREEN}    >> READY TO SIP. WAITING FOR DROPS. <<{Style.RESET}\n")
 
@@ -144,8 +86,10 @@ HEARTBEAT_TIMEOUT = 120
 CLAIM_INTERVAL_SECONDS = int(os.getenv("CLAIM_INTERVAL_SECONDS", "30"))
 DEV_WALLET = os.getenv("DEV_WALLET", "3CNH1A7NDRCJZ28y1Zm7cPhRuhgEMeKsBSs97Ez1gYwx")
 
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")  # DEBUG shows the DIM chatter (balance polls, lottery skips)
+set_log_level(LOG_LEVEL)
 DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
+FAST_STARTUP = os.getenv("FAST_STARTUP", "false").lower() == "true"  # Skip the startup animation delays
 
 # PumpPortal API (Fee Claiming)
 PUMPPORTAL_TRADE_API = "https://pumpportal.fun/api/trade-local"
@@ -175,6 +119,7 @@ last_action_time = 0
 last_market_event_time = time.time()
 
 def load_keypair(env_var="PRIVATE_KEY") -> Keypair:
+    from solders.keypair import Keypair
     try:
         key = os.getenv(env_var)
         if not key:
@@ -189,6 +134,7 @@ def load_keypair(env_var="PRIVATE_KEY") -> Keypair:
         raise ValueError(f"Failed to load keypair from {env_var}: {e}")
 
 def get_sol_balance(client: Client, pubkey_str: str) -> float:
+    from solders.pubkey import Pubkey
     try:
         pubkey = Pubkey.from_string(pubkey_str)
         response = client.get_balance(pubkey)
@@ -201,6 +147,7 @@ def get_token_balance_lamports(client: Client, wallet: str, mint: str) -> int:
     """Get SPL token balance in lamports (raw token units)"""
     try:
         from solana.rpc.types import TokenAccountOpts
+        from solders.pubkey import Pubkey
         
         wallet_pubkey = Pubkey.from_string(wallet)
         mint_pubkey = Pubkey.from_string(mint)
@@ -220,7 +167,7 @@ def get_token_balance_lamports(client: Client, wallet: str, mint: str) -> int:
                     return int(token_amount)
         return 0
     except Exception as e:
-        log("WARN", f"Token Balance check failed: {e}", Style.DIM)
+        log("WARN", "Token Balance check failed: {error}", Style.DIM, error=str(e))
         return 0
 
 def fetch_swap_transaction(from_mint: str, to_mint: str, amount: float, slippage: float, payer: str, priority_fee: float = 0.0005) -> bytes | None:
@@ -248,7 +195,8 @@ def fetch_swap_transaction(from_mint: str, to_mint: str, amount: float, slippage
             "Content-Type": "application/json"
         }
         
-        log("SWAP", f"Requesting swap: {amount} from {from_mint[:8]}... to {to_mint[:8]}...", Style.CYAN)
+        log("SWAP", "Requesting swap: {amount} from {from_mint:.8}... to {to_mint:.8}...", Style.CYAN,
+            amount=amount, from_mint=from_mint, to_mint=to_mint)
         
         response = requests.get(url, params=params, headers=headers, timeout=15)
         
@@ -301,6 +249,7 @@ def execute_swap(client: Client, keypair: Keypair, input_mint: str, output_mint:
 
 def sign_and_send_transaction(client: Client, keypair: Keypair, tx_bytes: bytes) -> str | None:
     from solana.rpc.types import TxOpts
+    from solders.transaction import VersionedTransaction
     try:
         tx = VersionedTransaction.from_bytes(tx_bytes)
         signed_tx = VersionedTransaction(tx.message, [keypair])
@@ -313,6 +262,10 @@ def sign_and_send_transaction(client: Client, keypair: Keypair, tx_bytes: bytes)
     return None
 
 def transfer_sol(client: Client, sender_keypair: Keypair, recipient_pubkey_str: str, amount_sol: float) -> str | None:
+    from solders.pubkey import Pubkey
+    from solders.system_program import transfer, TransferParams
+    from solders.message import Message
+    from solders.transaction import Transaction
     try:
         recipient = Pubkey.from_string(recipient_pubkey_str)
         lamports = int(amount_sol * LAMPORTS_PER_SOL)
@@ -417,7 +370,7 @@ def balance_consolidator_worker(client: Client, creator_keypair: Keypair, worker
     Periodically claims Pump.fun fees (if any) and consolidates creator wallet balance.
     """
     creator_pub = str(creator_keypair.pubkey())
-    log("SYSTEM", f"💰 Consolidator: ACTIVE (Pump Claim + 75% Tax) - {worker_pubkey_str[:6]}...", Style.YELLOW)
+    log("SYSTEM", f"💰 Consolidator: ACTIVE (Pump Claim + 75% Tax) - {worker_pubkey_str[:6]}...", Style.YELLOW, level=INFO)
     
     while True:
         time.sleep(CLAIM_INTERVAL_SECONDS)
@@ -465,7 +418,7 @@ def balance_consolidator_worker(client: Client, creator_keypair: Keypair, worker
                         log("SUCCESS", f"Claimed Pump Fees: https://solscan.io/tx/{sig}", Style.GREEN)
                         
             except Exception as e:
-                log("WARN", f"Fee Claim check: {e}", Style.DIM)
+                log("WARN", "Fee Claim check: {error}", Style.DIM, error=str(e))
 
             time.sleep(2)
 
@@ -473,7 +426,8 @@ def balance_consolidator_worker(client: Client, creator_keypair: Keypair, worker
             bal = get_sol_balance(client, creator_pub)
             total_transfer = bal - GAS_RESERVE
             
-            log("SYSTEM", f"Consolidator: {bal:.4f} SOL (Transferable: {total_transfer:.4f})", Style.DIM)
+            log("SYSTEM", "Consolidator: {bal:.4f} SOL (Transferable: {transferable:.4f})", Style.DIM,
+                bal=bal, transferable=total_transfer)
 
             if total_transfer > 0.005:
                 # 75% Dev Tax
@@ -552,6 +506,7 @@ def on_error(ws, error):
     log("ERROR", f"WS Error: {error}", Style.RED)
 
 def market_sensor_worker(client: Client, keypair: Keypair):
+    import websocket
     my_pubkey = str(keypair.pubkey())
     
     # Use RPC URL converted to WSS
@@ -615,7 +570,7 @@ def lottery_worker(client: Client, worker_keypair: Keypair):
             
             # Threshold: Don't sending dust. At least 0.02 SOL available.
             if bal < 0.02:
-                log("LOTTERY", f"Skipping: Low Balance ({bal:.3f} SOL)", Style.DIM)
+                log("LOTTERY", "Skipping: Low Balance ({bal:.3f} SOL)", Style.DIM, bal=bal)
                 time.sleep(60)  # Sleep before next iteration
                 continue
                 
@@ -623,14 +578,14 @@ def lottery_worker(client: Client, worker_keypair: Keypair):
             # Reserve gas first
             available = bal - GAS_RESERVE
             if available <= 0: 
-                 log("LOTTERY", f"Skipping: No available funds after gas. ({bal:.4f} SOL)", Style.DIM)
+                 log("LOTTERY", "Skipping: No available funds after gas. ({bal:.4f} SOL)", Style.DIM, bal=bal)
                  time.sleep(60)
                  continue
             
             prize = available * 0.10
             
             if prize < 0.0001: 
-                log("LOTTERY", f"Skipping: Prize too small ({prize:.6f} SOL)", Style.DIM)
+                log("LOTTERY", "Skipping: Prize too small ({prize:.6f} SOL)", Style.DIM, prize=prize)
                 time.sleep(60)
                 continue
 
@@ -696,6 +651,7 @@ def main():
     log("INIT", f"Creator: {str(creator_keypair.pubkey())[:6]}...", Style.DIM)
     log("INIT", f"Worker: {str(worker_keypair.pubkey())[:6]}...", Style.DIM)
 
+    from solana.rpc.api import Client
     client = Client(RPC_URL)
     
     t_consolidator = threading.Thread(target=balance_consolidator_worker, args=(client, creator_keypair, str(worker_keypair.pubkey())), daemon=True)
@@ -719,7 +675,7 @@ def main():
             if current_time - last_monitor_log > 10 and not position_state["active"]:
                  bal = get_sol_balance(client, str(worker_keypair.pubkey()))
                  color = Style.GREEN if bal > TRIGGER_THRESHOLD else Style.DIM
-                 log("MONITOR", f"💓 Pulse Check | Worker Balance: {bal:.4f} SOL", color)
+                 log("MONITOR", "💓 Pulse Check | Worker Balance: {bal:.4f} SOL", color, bal=bal)
                  last_monitor_log = current_time
 
             with state_lock:
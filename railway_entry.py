@@ -2,21 +2,29 @@
 import threading
 import sys
 import os
+from dotenv import load_dotenv
+
+# Load .env first so a FAST_STARTUP=false there (or in the real environment) wins
+# over the default below; main's own load_dotenv() never overrides existing vars.
+load_dotenv()
+# Skip the startup animation delays unless explicitly disabled (FAST_STARTUP=false)
+os.environ.setdefault("FAST_STARTUP", "true")
 
 # Import the existing modules
 # We need to ensure we can run them as threads or sub-processes
 import server
-import main
 
 if __name__ == "__main__":
     print("❄️  INITIALIZING BLIZZARD PROTOCOL FOR RAILWAY ❄️")
     
-    # 1. Start the Web Server (Daemon thread)
+    # 1. Start the Web Server (Daemon thread) before loading the bot,
+    # so health checks and the dashboard answer while main is still importing
     t_server = threading.Thread(target=server.run_server, daemon=True)
     t_server.start()
     
     # 2. Run the Main Bot (Blocking-ish, but has its own threads)
     # We call main.main() which enters a while True loop
+    import main
     try:
         main.main()
     except KeyboardInterrupt:
@@ -1,22 +1,210 @@
 import http.server
-import socketserver
 import webbrowser
 import os
+import io
+import gzip
+import json
+import bisect
+import email.utils
+import urllib.parse
 import threading
 import time
 import traceback
+from logsink import LOG_FILE_PATH
 
 PORT = int(os.getenv("PORT", 8000))
 DIRECTORY = "web"
 
+# Text assets worth compressing (logs.json is the one polled every 500ms)
+GZIP_TYPES = ("application/json", "text/html", "text/css", "text/javascript", "application/javascript")
+GZIP_MIN_BYTES = 512
+
+class LogFeed:
+    """Parsed view of the logs.json snapshot, re-read only when the log writer publishes a new one.
+
+    Reads the file rather than the in-process sink so it also works when server.py
+    runs in a different process than main.py.
+    """
+
+    def __init__(self, path: str = LOG_FILE_PATH):
+        self.path = path
+        self._version = None
+        self._snapshot = ([], [])  # (entries, seqs), always replaced as one object
+        self._lock = threading.Lock()
+
+    def since(self, cursor: int) -> tuple[int, list]:
+        """Return (latest seq, entries with seq > cursor)."""
+        self._refresh()
+        entries, seqs = self._snapshot
+        latest = seqs[-1] if seqs else 0
+        if cursor > latest:
+            # Cursor from a previous log history (files wiped): resend everything
+            cursor = 0
+        return latest, entries[bisect.bisect_right(seqs, cursor):]
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        version = (st.st_mtime_ns, st.st_size)
+        if version == self._version:
+            return
+        with self._lock:
+            if version == self._version:
+                return
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                return
+            entries = [e for e in data if isinstance(e, dict)]
+            # Single attribute store: readers always see a matching (entries, seqs) pair
+            self._snapshot = (entries, [e.get("seq", 0) for e in entries])
+            self._version = version
+
+log_feed = LogFeed()
+
 class Handler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive so pollers reuse one connection instead of reconnecting every poll
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+    # Headers and body go out in separate writes; with Nagle on, keep-alive clients
+    # stall ~40ms per response waiting on a delayed ACK
+    disable_nagle_algorithm = True
+
+    _gzip_cache = {}  # path -> (etag, compressed bytes), shared by every handler thread
+    _gzip_lock = threading.Lock()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
 
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/api/logs":
+            self.send_log_feed(urllib.parse.parse_qs(url.query))
+        else:
+            super().do_GET()
+
+    def send_log_feed(self, query: dict):
+        """GET /api/logs?since=<seq> -> {"cursor": latest seq, "entries": [entries after since]}"""
+        try:
+            cursor = int(query.get("since", ["0"])[0])
+        except ValueError:
+            self.send_error(400, "since must be an integer")
+            return
+
+        latest, entries = log_feed.since(cursor)
+        body = json.dumps({"cursor": latest, "entries": entries}).encode()
+        use_gzip = len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            body = gzip.compress(body, compresslevel=6, mtime=0)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_head(self):
+        """Serve files with ETag/Last-Modified, 304 revalidation and gzip."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.split("?", 1)[0].endswith("/"):
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            # Directory redirects, listings and 404s keep the stock behaviour
+            return super().send_head()
+
+        try:
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+
+        try:
+            # fstat the open handle: logs.json is swapped via os.replace while we serve it
+            st = os.fstat(f.fileno())
+            ctype = self.guess_type(path)
+            use_gzip = (ctype in GZIP_TYPES and st.st_size >= GZIP_MIN_BYTES
+                        and "gzip" in self.headers.get("Accept-Encoding", ""))
+            etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}{"-gz" if use_gzip else ""}"'
+            last_modified = self.date_time_string(st.st_mtime)
+
+            if self._not_modified(etag, st.st_mtime):
+                f.close()
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                return None
+
+            if use_gzip:
+                body = self._gzip_body(path, etag, f)
+                f.close()
+                f = io.BytesIO(body)
+                length = len(body)
+            else:
+                length = st.st_size
+
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(length))
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            # Cache, but revalidate every time (answered with a cheap 304)
+            self.send_header("Cache-Control", "no-cache")
+            if ctype in GZIP_TYPES:
+                self.send_header("Vary", "Accept-Encoding")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        if "If-None-Match" in self.headers:
+            tags = [t.strip() for t in self.headers["If-None-Match"].split(",")]
+            return etag in tags or "*" in tags
+        if "If-Modified-Since" in self.headers:
+            try:
+                since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since is None or since.tzinfo is None:
+                return False
+            # Header dates have 1s resolution and logs.json changes several times a second:
+            # a file written during the current second may still change within that second,
+            # so it is never reported as unchanged by date alone.
+            return int(mtime) <= since.timestamp() and int(mtime) < int(time.time())
+        return False
+
+    def _gzip_body(self, path: str, etag: str, f) -> bytes:
+        """Compress once per file version; every poller after that reuses the bytes."""
+        with self._gzip_lock:
+            cached = self._gzip_cache.get(path)
+        if cached and cached[0] == etag:
+            return cached[1]
+        body = gzip.compress(f.read(), compresslevel=6, mtime=0)
+        with self._gzip_lock:
+            self._gzip_cache[path] = (etag, body)
+        return body
+
     def log_message(self, format, *args):
         # Silence server logs to keep terminal clean
         pass
 
+class DashboardServer(http.server.ThreadingHTTPServer):
+    """One thread per connection so a slow viewer never stalls the others."""
+    # Default backlog is 5; a burst of dashboard tabs reconnecting overflows it (1s SYN retry)
+    request_queue_size = 128
+
 def open_browser():
     # Only open browser if NOT in a cloud environment
     if not os.getenv("RAILWAY_STATIC_URL") and not os.getenv("RAILWAY_ENVIRONMENT"):
@@ -39,7 +227,7 @@ def run_server():
             print(f"✅ Created directory: {DIRECTORY}")
         
         # Listen on all interfaces (0.0.0.0) which is required for containers
-        with socketserver.TCPServer(("0.0.0.0", PORT), Handler) as httpd:
+        with DashboardServer(("0.0.0.0", PORT), Handler) as httpd:
             print(f"✅ BLIZZARD LOG SERVER ACTIVE: http://0.0.0.0:{PORT}")
             print(f"    Railway URL: https://blizzard.up.railway.app/")
             print(f"    (Server running in background thread)\n")
@@ -0,0 +1,52 @@
+import json
+
+import logsink
+
+
+def make_sink(tmp_path) -> logsink.LogSink:
+    public = tmp_path / "web" / "public"
+    return logsink.LogSink(snapshot_path=str(public / "logs.json"), stream_path=str(public / "logs.jsonl"))
+
+def entry(msg: str) -> dict:
+    return {"timestamp": "00:00:00", "tag": "T", "msg": msg, "color": "[97m"}
+
+def test_seq_is_monotonic(tmp_path):
+    sink = make_sink(tmp_path)
+    first, second = entry("a"), entry("b")
+    sink.emit(first)
+    sink.emit(second)
+    assert (first["seq"], second["seq"]) == (1, 2)
+
+def test_seq_resumes_after_restore(tmp_path):
+    sink = make_sink(tmp_path)
+    for msg in ("a", "b", "c"):
+        sink.emit(entry(msg))
+    sink.flush()
+
+    restarted = make_sink(tmp_path)
+    new = entry("d")
+    restarted.emit(new)
+    assert new["seq"] == 4
+
+def test_restore_numbers_legacy_snapshot(tmp_path):
+    public = tmp_path / "web" / "public"
+    public.mkdir(parents=True)
+    # Snapshot written before entries carried a seq
+    (public / "logs.json").write_text(json.dumps([entry("old1"), entry("old2")]))
+
+    sink = make_sink(tmp_path)
+    new = entry("new")
+    sink.emit(new)
+    sink.flush()
+
+    snapshot = json.loads((public / "logs.json").read_text())
+    assert [e["seq"] for e in snapshot] == [1, 2, 3]
+    assert new["seq"] == 3
+
+def test_level_for_maps_tags_and_colors():
+    assert logsink.level_for("ERROR", logsink.Style.RED) == logsink.ERROR
+    assert logsink.level_for("WARN", logsink.Style.DIM) == logsink.WARNING
+    # Yellow warnings under other tags (SKIP, LOTTERY) must survive LOG_LEVEL=WARN
+    assert logsink.level_for("SKIP", logsink.Style.YELLOW) == logsink.WARNING
+    assert logsink.level_for("SYSTEM", logsink.Style.DIM) == logsink.DEBUG
+    assert logsink.level_for("BUY", logsink.Style.GREEN) == logsink.INFO
@@ -0,0 +1,99 @@
+import os
+import json
+import time
+import threading
+import http.client
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """Serve a throwaway web/ directory on a free port."""
+    os.makedirs(tmp_path / "web" / "public")
+    monkeypatch.chdir(tmp_path)
+    httpd = server.DashboardServer(("127.0.0.1", 0), server.Handler)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield tmp_path / "web" / "public", httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+def get(port: int, path: str, headers: dict | None = None) -> http.client.HTTPResponse:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request("GET", path, headers=headers or {})
+    res = conn.getresponse()
+    res.read()
+    conn.close()
+    return res
+
+def test_if_modified_since_echo_returns_304(dashboard):
+    public, port = dashboard
+    path = public / "logs.json"
+    path.write_text("[]")
+    old = time.time() - 100
+    os.utime(path, (old, old))
+
+    first = get(port, "/public/logs.json")
+    assert first.status == 200
+
+    again = get(port, "/public/logs.json", {"If-Modified-Since": first.getheader("Last-Modified")})
+    assert again.status == 304
+
+def test_if_modified_since_not_trusted_for_current_second(dashboard):
+    public, port = dashboard
+    path = public / "logs.json"
+    path.write_text("[]")
+    # mtime not yet in a closed second: the file may still change under the same date
+    future = time.time() + 50
+    os.utime(path, (future, future))
+
+    first = get(port, "/public/logs.json")
+    again = get(port, "/public/logs.json", {"If-Modified-Since": first.getheader("Last-Modified")})
+    assert again.status == 200
+
+def test_if_none_match_returns_304(dashboard):
+    public, port = dashboard
+    (public / "logs.json").write_text("[]")
+
+    first = get(port, "/public/logs.json")
+    again = get(port, "/public/logs.json", {"If-None-Match": first.getheader("ETag")})
+    assert again.status == 304
+
+def write_feed(path, seqs: list):
+    path.write_text(json.dumps([{"tag": "T", "msg": f"m{seq}", "seq": seq} for seq in seqs]))
+
+def test_log_feed_since_cursor(tmp_path):
+    path = tmp_path / "logs.json"
+    write_feed(path, [4, 5, 6])
+    feed = server.LogFeed(str(path))
+
+    latest, entries = feed.since(4)
+    assert latest == 6
+    assert [e["seq"] for e in entries] == [5, 6]
+
+    # Caught up: nothing new, cursor stays put
+    assert feed.since(6) == (6, [])
+
+def test_log_feed_cursor_past_latest_resends_everything(tmp_path):
+    path = tmp_path / "logs.json"
+    write_feed(path, [1, 2])
+    feed = server.LogFeed(str(path))
+
+    latest, entries = feed.since(99)
+    assert latest == 2
+    assert [e["seq"] for e in entries] == [1, 2]
+
+def test_log_feed_picks_up_new_snapshot(tmp_path):
+    path = tmp_path / "logs.json"
+    write_feed(path, [1, 2])
+    feed = server.LogFeed(str(path))
+    assert feed.since(0)[0] == 2
+
+    write_feed(path, [2, 3, 4])
+    os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+    latest, entries = feed.since(2)
+    assert latest == 4
+    assert [e["seq"] for e in entries] == [3, 4]